@@ -30,7 +30,6 @@ from sqlalchemy.orm import Session, relationship
 from sqlalchemy.types import PickleType
 
 from packit_service.service.events import InstallationEvent
-from packit_service.constants import ALLOWLIST_CONSTANTS
 
 # revision identifiers, used by Alembic.
 revision = "c6250555a36c"
@@ -102,9 +101,9 @@ class TaskResultUpgradeModel(Base):
 
 
 class WhitelistStatus(str, enum.Enum):
-    approved_automatically = ALLOWLIST_CONSTANTS["approved_automatically"]
-    waiting = ALLOWLIST_CONSTANTS["waiting"]
-    approved_manually = ALLOWLIST_CONSTANTS["approved_manually"]
+    approved_automatically = "approved_automatically"
+    waiting = "waiting"
+    approved_manually = "approved_manually"
 
 
 class WhitelistUpgradeModel(Base):
@@ -4,7 +4,7 @@
 import enum
 import logging
 from pathlib import Path
-from typing import List, Optional, Set, Union, NamedTuple
+from typing import FrozenSet, List, Optional, Set, Union, NamedTuple
 
 from yaml import safe_load
 
@@ -125,7 +125,7 @@ class ServiceConfig(Config):
         # e.g.:
         #  - github.com/other-private-namespace
         #  - gitlab.com/private/namespace
-        self.enabled_private_namespaces: Set[str] = set(
+        self.enabled_private_namespaces: FrozenSet[str] = frozenset(
             enabled_private_namespaces or []
         )
 
@@ -38,16 +38,20 @@ COPR_API_FAIL_STATE = 2
 PG_COPR_BUILD_STATUS_FAILURE = "failure"
 PG_COPR_BUILD_STATUS_SUCCESS = "success"
 
+# build statuses (as stored in our database) which can never change again
+PG_BUILD_TERMINAL_STATUSES = frozenset(
+    (PG_COPR_BUILD_STATUS_SUCCESS, PG_COPR_BUILD_STATUS_FAILURE, "failed", "error")
+)
+
+# Cache-Control values for the API: lists change within seconds,
+# finished builds never do
+CACHE_CONTROL_LISTS = "public, max-age=15, s-maxage=15"
+CACHE_CONTROL_TERMINAL_BUILD = "public, max-age=86400, immutable"
+
 DEFAULT_RETRY_LIMIT = 2
 # retry in 3s, 6s
 DEFAULT_RETRY_BACKOFF = 3
 
-ALLOWLIST_CONSTANTS = {
-    "approved_automatically": "approved_automatically",
-    "waiting": "waiting",
-    "approved_manually": "approved_manually",
-}
-
 
 class KojiBuildState(Enum):
     """
@@ -29,10 +29,15 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import array as psql_array
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, relationship, scoped_session, sessionmaker
+from sqlalchemy.orm import (
+    Session,
+    joinedload,
+    relationship,
+    scoped_session,
+    sessionmaker,
+)
 from sqlalchemy.types import ARRAY
 
-from packit_service.constants import ALLOWLIST_CONSTANTS
 
 logger = logging.getLogger(__name__)
 # SQLAlchemy session, get it with `get_sa_session`
@@ -48,8 +53,23 @@ def get_pg_url() -> str:
     )
 
 
-engine = create_engine(get_pg_url())
-ScopedSession = scoped_session(sessionmaker(bind=engine))
+engine = create_engine(
+    get_pg_url(),
+    # the list endpoints need a few overlapping cursors per request;
+    # the default pool of 5 makes them queue on checkouts under load
+    pool_size=20,
+    max_overflow=40,
+    # fail fast instead of hanging the request when the pool is exhausted
+    pool_timeout=10,
+    # transparently replace connections dropped by the server/firewall
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+# expire_on_commit=False: get_sa_session commits on exit, and expiring the
+# instances there would wipe the eagerly loaded/preloaded state (triggers,
+# projects) we rely on when serializing responses - every attribute access
+# would lazy-load again
+ScopedSession = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
 
 
 @contextmanager
@@ -567,12 +587,45 @@ class JobTriggerModel(Base):
             return trigger
 
     def get_trigger_object(self) -> AbstractTriggerDbType:
+        # cached on the instance: the trigger object tends to be asked for
+        # repeatedly (project, PR id, branch name, release tag) and each
+        # call used to be a separate SELECT
+        if getattr(self, "_trigger_object", None) is None:
+            with get_sa_session() as session:
+                self._trigger_object = (
+                    session.query(MODEL_FOR_TRIGGER[self.type])
+                    .filter_by(id=self.trigger_id)
+                    .first()
+                )
+        return self._trigger_object
+
+    @classmethod
+    def preload_trigger_objects(cls, triggers: Iterable["JobTriggerModel"]) -> None:
+        """
+        Resolve trigger objects for all given triggers in bulk (one query per
+        trigger type, with the related project eager-loaded) and cache them,
+        so that subsequent get_trigger_object() calls don't hit the database
+        one row at a time.
+        """
+        triggers_by_type: Dict[JobTriggerModelType, list] = {}
+        for trigger in triggers:
+            # builds are not guaranteed to have a trigger stored in db
+            if trigger is None:
+                continue
+            if getattr(trigger, "_trigger_object", None) is None:
+                triggers_by_type.setdefault(trigger.type, []).append(trigger)
+
         with get_sa_session() as session:
-            return (
-                session.query(MODEL_FOR_TRIGGER[self.type])
-                .filter_by(id=self.trigger_id)
-                .first()
-            )
+            for type_, typed_triggers in triggers_by_type.items():
+                model = MODEL_FOR_TRIGGER[type_]
+                trigger_objects = {
+                    trigger_object.id: trigger_object
+                    for trigger_object in session.query(model)
+                    .filter(model.id.in_({t.trigger_id for t in typed_triggers}))
+                    .options(joinedload(model.project))
+                }
+                for trigger in typed_triggers:
+                    trigger._trigger_object = trigger_objects.get(trigger.trigger_id)
 
     def __repr__(self):
         return f"JobTriggerModel(type={self.type}, trigger_id={self.trigger_id})"
@@ -661,6 +714,20 @@ class CoprBuildModel(Base):
         with get_sa_session() as session:
             return session.query(CoprBuildModel).filter_by(id=id_).first()
 
+    @classmethod
+    def get_by_ids(cls, ids: Iterable[int]) -> Iterable["CoprBuildModel"]:
+        """
+        Fetch builds for all given ids in a single query,
+        with job triggers eager-loaded.
+        """
+        with get_sa_session() as session:
+            return (
+                session.query(CoprBuildModel)
+                .filter(CoprBuildModel.id.in_(ids))
+                .options(joinedload(CoprBuildModel.job_trigger))
+                .all()
+            )
+
     @classmethod
     def get_all(cls) -> Optional[Iterable["CoprBuildModel"]]:
         with get_sa_session() as session:
@@ -668,14 +735,14 @@ class CoprBuildModel(Base):
 
     @classmethod
     def get_merged_chroots(
-        cls, first: int, last: int
+        cls, first: int, last: int, after: Optional[int] = None
     ) -> Optional[Iterable["CoprBuildModel"]]:
         """Returns a list of unique build ids with merged status, chroots
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
         """
         with get_sa_session() as session:
-            builds = (
+            query = (
                 session.query(
                     # We need something to order our merged builds by,
                     # so set new_id to be min(ids of to-be-merged rows)
@@ -687,10 +754,17 @@ class CoprBuildModel(Base):
                     func.array_agg(psql_array([CoprBuildModel.status])).label("status"),
                 )
                 .group_by(CoprBuildModel.build_id)  # Group by identical element(s)
-                .order_by(desc("new_id"))[first:last]
+                .order_by(desc("new_id"))
             )
-
-            return builds
+            if after is not None:
+                # keyset pagination: seek by id instead of scanning
+                # and discarding OFFSET rows
+                return (
+                    query.having(func.min(CoprBuildModel.id) < after)
+                    .limit(last - first)
+                    .all()
+                )
+            return query[first:last]
 
     # Returns all builds with that build_id, irrespective of target
     @classmethod
@@ -864,11 +938,20 @@ class KojiBuildModel(Base):
             return session.query(KojiBuildModel).all()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Optional[Iterable["KojiBuildModel"]]:
+    def get_range(
+        cls, first: int, last: int, after: Optional[int] = None
+    ) -> Optional[Iterable["KojiBuildModel"]]:
         with get_sa_session() as session:
-            return session.query(KojiBuildModel).order_by(desc(KojiBuildModel.id))[
-                first:last
-            ]
+            query = (
+                session.query(KojiBuildModel)
+                .options(joinedload(KojiBuildModel.job_trigger))
+                .order_by(desc(KojiBuildModel.id))
+            )
+            if after is not None:
+                # keyset pagination: seek by id instead of scanning
+                # and discarding OFFSET rows
+                return query.filter(KojiBuildModel.id < after).limit(last - first).all()
+            return query[first:last]
 
     # Returns all builds with that build_id, irrespective of target
     @classmethod
@@ -976,9 +1059,11 @@ class SRPMBuildModel(Base):
     @classmethod
     def get(cls, first: int, last: int) -> Optional[Iterable["SRPMBuildModel"]]:
         with get_sa_session() as session:
-            return session.query(SRPMBuildModel).order_by(desc(SRPMBuildModel.id))[
-                first:last
-            ]
+            return (
+                session.query(SRPMBuildModel)
+                .options(joinedload(SRPMBuildModel.job_trigger))
+                .order_by(desc(SRPMBuildModel.id))[first:last]
+            )
 
     def get_project(self) -> Optional[GitProjectModel]:
         if not self.job_trigger_id:
@@ -1020,9 +1105,9 @@ class SRPMBuildModel(Base):
 
 
 class AllowlistStatus(str, enum.Enum):
-    approved_automatically = ALLOWLIST_CONSTANTS["approved_automatically"]
-    waiting = ALLOWLIST_CONSTANTS["waiting"]
-    approved_manually = ALLOWLIST_CONSTANTS["approved_manually"]
+    approved_automatically = "approved_automatically"
+    waiting = "waiting"
+    approved_manually = "approved_manually"
 
 
 class AllowlistModel(Base):
@@ -1183,9 +1268,11 @@ class TFTTestRunModel(Base):
     @classmethod
     def get_range(cls, first: int, last: int) -> Optional[Iterable["TFTTestRunModel"]]:
         with get_sa_session() as session:
-            return session.query(TFTTestRunModel).order_by(desc(TFTTestRunModel.id))[
-                first:last
-            ]
+            return (
+                session.query(TFTTestRunModel)
+                .options(joinedload(TFTTestRunModel.job_trigger))
+                .order_by(desc(TFTTestRunModel.id))[first:last]
+            )
 
 
 class ProjectAuthenticationIssueModel(Base):
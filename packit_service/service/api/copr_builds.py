@@ -4,11 +4,26 @@
 from http import HTTPStatus
 from logging import getLogger
 
+from flask import make_response, request
 from flask_restx import Namespace, Resource
 
-from packit_service.models import CoprBuildModel, optional_time
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.constants import (
+    CACHE_CONTROL_LISTS,
+    CACHE_CONTROL_TERMINAL_BUILD,
+    PG_BUILD_TERMINAL_STATUSES,
+)
+from packit_service.models import CoprBuildModel, JobTriggerModel, optional_time
+from packit_service.service.api.parsers import (
+    indices,
+    keyset_marker,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    build_etag,
+    get_project_info_from_build,
+    response_maker,
+    streamed_response,
+)
 
 logger = getLogger("packit_service")
 
@@ -25,39 +40,65 @@ class CoprBuildsList(Resource):
         # Return relevant info thats concise
         # Usecases like the packit-dashboard copr-builds table
 
-        result = []
-
         first, last = indices()
-        for build in CoprBuildModel.get_merged_chroots(first, last):
-            build_info = CoprBuildModel.get_by_build_id(build.build_id, None)
-            project_info = build_info.get_project()
-            build_dict = {
-                "project": build_info.project_name,
-                "build_id": build.build_id,
-                "status_per_chroot": {},
-                "packit_id_per_chroot": {},
-                "build_submitted_time": optional_time(build_info.build_submitted_time),
-                "web_url": build_info.web_url,
-                "ref": build_info.commit_sha,
-                "pr_id": build_info.get_pr_id(),
-                "branch_name": build_info.get_branch_name(),
-                "repo_namespace": project_info.namespace,
-                "repo_name": project_info.repo_name,
-                "project_url": project_info.project_url,
-            }
-
-            for count, chroot in enumerate(build.target):
-                # [0] because sqlalchemy returns a single element sub-list
-                build_dict["status_per_chroot"][chroot[0]] = build.status[count][0]
-                build_dict["packit_id_per_chroot"][chroot[0]] = build.new_id
-
-            result.append(build_dict)
-
-        resp = response_maker(
-            result,
+        after = keyset_marker()
+        merged_builds = CoprBuildModel.get_merged_chroots(first, last, after=after)
+        # fetch the whole page worth of builds and their triggers/projects
+        # up front instead of two queries per row
+        builds_info = {
+            build.id: build
+            for build in CoprBuildModel.get_by_ids(
+                [build.new_id for build in merged_builds]
+            )
+        }
+        JobTriggerModel.preload_trigger_objects(
+            build.job_trigger for build in builds_info.values()
+        )
+
+        def copr_builds():
+            for build in merged_builds:
+                build_info = builds_info[build.new_id]
+                project_info = build_info.get_project()
+                build_dict = {
+                    "project": build_info.project_name,
+                    "build_id": build.build_id,
+                    # [0] because sqlalchemy returns single element sub-lists
+                    "status_per_chroot": {
+                        chroot[0]: status[0]
+                        for chroot, status in zip(build.target, build.status)
+                    },
+                    "packit_id_per_chroot": dict.fromkeys(
+                        (chroot[0] for chroot in build.target), build.new_id
+                    ),
+                    "build_submitted_time": optional_time(
+                        build_info.build_submitted_time
+                    ),
+                    "web_url": build_info.web_url,
+                    "ref": build_info.commit_sha,
+                    "pr_id": build_info.get_pr_id(),
+                    "branch_name": build_info.get_branch_name(),
+                    "repo_namespace": project_info.namespace,
+                    "repo_name": project_info.repo_name,
+                    "project_url": project_info.project_url,
+                }
+
+                yield build_dict
+
+        # stream the rows instead of building the whole list in memory
+        resp = streamed_response(
+            copr_builds(),
             status=HTTPStatus.PARTIAL_CONTENT.value,
         )
-        resp.headers["Content-Range"] = f"copr-builds {first + 1}-{last}/*"
+        if after is None:
+            # the offsets are meaningless on a keyset-paginated request
+            resp.headers["Content-Range"] = f"copr-builds {first + 1}-{last}/*"
+        resp.headers["Cache-Control"] = CACHE_CONTROL_LISTS
+        if merged_builds:
+            # keyset continuation: constant-time even for deep pages
+            resp.headers["Link"] = (
+                f"<{request.base_url}?after={merged_builds[-1].new_id}"
+                f'&per_page={last - first}>; rel="next"'
+            )
         return resp
 
 
@@ -75,6 +116,12 @@ class CoprBuildItem(Resource):
                 status=HTTPStatus.NOT_FOUND.value,
             )
 
+        etag = build_etag(build)
+        if request.if_none_match.contains(etag):
+            # dashboards poll this endpoint; skip the serialization
+            # (and the project lookups) when the client is up to date
+            return make_response("", HTTPStatus.NOT_MODIFIED.value)
+
         build_dict = {
             "build_id": build.build_id,
             "status": build.status,
@@ -87,8 +134,12 @@ class CoprBuildItem(Resource):
             "build_logs_url": build.build_logs_url,
             "copr_project": build.project_name,
             "copr_owner": build.owner,
-            "srpm_build_id": build.srpm_build.id,
+            "srpm_build_id": build.srpm_build_id,
         }
 
         build_dict.update(get_project_info_from_build(build))
-        return response_maker(build_dict)
+        resp = response_maker(build_dict)
+        resp.set_etag(etag)
+        if build.status in PG_BUILD_TERMINAL_STATUSES:
+            resp.headers["Cache-Control"] = CACHE_CONTROL_TERMINAL_BUILD
+        return resp
@@ -4,11 +4,26 @@
 from http import HTTPStatus
 from logging import getLogger
 
+from flask import make_response, request
 from flask_restx import Namespace, Resource
 
-from packit_service.models import KojiBuildModel, optional_time
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.constants import (
+    CACHE_CONTROL_LISTS,
+    CACHE_CONTROL_TERMINAL_BUILD,
+    PG_BUILD_TERMINAL_STATUSES,
+)
+from packit_service.models import JobTriggerModel, KojiBuildModel, optional_time
+from packit_service.service.api.parsers import (
+    indices,
+    keyset_marker,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    build_etag,
+    get_project_info_from_build,
+    response_maker,
+    streamed_response,
+)
 
 logger = getLogger("packit_service")
 
@@ -23,36 +38,53 @@ class KojiBuildsList(Resource):
         """ List all Koji builds. """
 
         first, last = indices()
-        result = []
-
-        for build in KojiBuildModel.get_range(first, last):
-            build_dict = {
-                "packit_id": build.id,
-                "build_id": build.build_id,
-                "status": build.status,
-                "build_submitted_time": optional_time(build.build_submitted_time),
-                "chroot": build.target,
-                "web_url": build.web_url,
-                # from old data, sometimes build_logs_url is same and sometimes different to web_url
-                "build_logs_url": build.build_logs_url,
-                "pr_id": build.get_pr_id(),
-                "branch_name": build.get_branch_name(),
-                "release": build.get_release_tag(),
-            }
-
-            project = build.get_project()
-            if project:
-                build_dict["project_url"] = project.project_url
-                build_dict["repo_namespace"] = project.namespace
-                build_dict["repo_name"] = project.repo_name
-
-            result.append(build_dict)
-
-        resp = response_maker(
-            result,
+        after = keyset_marker()
+
+        builds = KojiBuildModel.get_range(first, last, after=after)
+        # resolve triggers/projects for the whole page in bulk
+        # instead of one query per build
+        JobTriggerModel.preload_trigger_objects(build.job_trigger for build in builds)
+
+        def koji_builds():
+            for build in builds:
+                build_dict = {
+                    "packit_id": build.id,
+                    "build_id": build.build_id,
+                    "status": build.status,
+                    "build_submitted_time": optional_time(build.build_submitted_time),
+                    "chroot": build.target,
+                    "web_url": build.web_url,
+                    # from old data, sometimes build_logs_url is same
+                    # and sometimes different to web_url
+                    "build_logs_url": build.build_logs_url,
+                    "pr_id": build.get_pr_id(),
+                    "branch_name": build.get_branch_name(),
+                    "release": build.get_release_tag(),
+                }
+
+                project = build.get_project()
+                if project:
+                    build_dict["project_url"] = project.project_url
+                    build_dict["repo_namespace"] = project.namespace
+                    build_dict["repo_name"] = project.repo_name
+
+                yield build_dict
+
+        # stream the rows instead of building the whole list in memory
+        resp = streamed_response(
+            koji_builds(),
             status=HTTPStatus.PARTIAL_CONTENT.value,
         )
-        resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
+        if after is None:
+            # the offsets are meaningless on a keyset-paginated request
+            resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
+        resp.headers["Cache-Control"] = CACHE_CONTROL_LISTS
+        if builds:
+            # keyset continuation: constant-time even for deep pages
+            resp.headers["Link"] = (
+                f"<{request.base_url}?after={builds[-1].id}"
+                f'&per_page={last - first}>; rel="next"'
+            )
         return resp
 
 
@@ -73,6 +105,12 @@ class KojiBuildItem(Resource):
                 status=HTTPStatus.NOT_FOUND.value,
             )
 
+        etag = build_etag(build)
+        if request.if_none_match.contains(etag):
+            # dashboards poll this endpoint; skip the serialization
+            # (and the project lookups) when the client is up to date
+            return make_response("", HTTPStatus.NOT_MODIFIED.value)
+
         build_dict = {
             "build_id": build.build_id,
             "status": build.status,
@@ -84,8 +122,12 @@ class KojiBuildItem(Resource):
             "web_url": build.web_url,
             # from old data, sometimes build_logs_url is same and sometimes different to web_url
             "build_logs_url": build.build_logs_url,
-            "srpm_build_id": build.srpm_build.id,
+            "srpm_build_id": build.srpm_build_id,
         }
 
         build_dict.update(get_project_info_from_build(build))
-        return response_maker(build_dict)
+        resp = response_maker(build_dict)
+        resp.set_etag(etag)
+        if build.status in PG_BUILD_TERMINAL_STATUSES:
+            resp.headers["Cache-Control"] = CACHE_CONTROL_TERMINAL_BUILD
+        return resp
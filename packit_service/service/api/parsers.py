@@ -20,6 +20,12 @@ pagination_arguments.add_argument(
     default=DEFAULT_PER_PAGE,
     help="Results per page",
 )
+pagination_arguments.add_argument(
+    "after",
+    type=int,
+    required=False,
+    help="Keyset pagination: return entries older than this packit id",
+)
 
 
 def indices():
@@ -32,3 +38,12 @@ def indices():
     first = (page - 1) * per_page
     last = page * per_page
     return first, last
+
+
+def keyset_marker():
+    """
+    Id after which the client wants to continue reading, if they opted
+    into keyset pagination ('?after=<id of the last entry seen>').
+    Unlike OFFSET, seeking by id stays fast no matter how deep the page is.
+    """
+    return pagination_arguments.parse_args(request).get("after")
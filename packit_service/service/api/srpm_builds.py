@@ -8,7 +8,7 @@ from logging import getLogger
 from flask import url_for
 from flask_restx import Namespace, Resource
 
-from packit_service.models import SRPMBuildModel, optional_time
+from packit_service.models import JobTriggerModel, SRPMBuildModel, optional_time
 from packit_service.service.api.parsers import indices, pagination_arguments
 from packit_service.service.api.utils import get_project_info_from_build, response_maker
 
@@ -27,7 +27,11 @@ class SRPMBuildsList(Resource):
         result = []
 
         first, last = indices()
-        for build in SRPMBuildModel.get(first, last):
+        builds = SRPMBuildModel.get(first, last)
+        # resolve triggers/projects for the whole page in bulk
+        # instead of one query per build
+        JobTriggerModel.preload_trigger_objects(build.job_trigger for build in builds)
+        for build in builds:
             build_dict = {
                 "srpm_build_id": build.id,
                 "success": build.success,
@@ -9,7 +9,7 @@ from flask_restx import Namespace, Resource, fields
 
 from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
-from packit_service.models import TFTTestRunModel
+from packit_service.models import JobTriggerModel, TFTTestRunModel
 from packit_service.service.api.errors import ValidationFailed
 from packit_service.service.api.parsers import indices, pagination_arguments
 from packit_service.service.api.utils import get_project_info_from_build, response_maker
@@ -101,7 +101,13 @@ class TestingFarmResults(Resource):
         first, last = indices()
         # results have nothing other than ref in common, so it doesnt make sense to
         # merge them like copr builds
-        for tf_result in TFTTestRunModel.get_range(first, last):
+        tf_results = TFTTestRunModel.get_range(first, last)
+        # resolve triggers/projects for the whole page in bulk
+        # instead of one query per result
+        JobTriggerModel.preload_trigger_objects(
+            tf_result.job_trigger for tf_result in tf_results
+        )
+        for tf_result in tf_results:
             result_dict = {
                 "packit_id": tf_result.id,
                 "pipeline_id": tf_result.pipeline_id,
@@ -1,8 +1,8 @@
 from http import HTTPStatus
-from json import dumps
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, Union
 
-from flask import make_response
+from flask import Response, make_response
+from orjson import dumps
 
 from packit_service.models import (
     CoprBuildModel,
@@ -11,18 +11,46 @@ from packit_service.models import (
     TFTTestRunModel,
 )
 
+AnyBuild = Union[SRPMBuildModel, CoprBuildModel, KojiBuildModel, TFTTestRunModel]
+
 
 def response_maker(result, status=HTTPStatus.OK.value):
     """response_maker is a wrapper around flask's make_response"""
+    # orjson serializes a typical build page several times faster
+    # than the stdlib json module
     resp = make_response(dumps(result), status)
     resp.headers["Content-Type"] = "application/json"
     resp.headers["Access-Control-Allow-Origin"] = "*"
     return resp
 
 
-def get_project_info_from_build(
-    build: Union[SRPMBuildModel, CoprBuildModel, KojiBuildModel, TFTTestRunModel]
-) -> Dict[str, Any]:
+def streamed_response(rows: Iterator[Any], status=HTTPStatus.OK.value):
+    """
+    Like response_maker, but streams a JSON array row by row
+    instead of materializing the whole list in memory first.
+    """
+
+    def generate():
+        yield b"["
+        for count, row in enumerate(rows):
+            yield (b"," if count else b"") + dumps(row)
+        yield b"]"
+
+    resp = Response(generate(), status=status)
+    resp.headers["Content-Type"] = "application/json"
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    return resp
+
+
+def build_etag(build: Union[CoprBuildModel, KojiBuildModel]) -> str:
+    """ETag of a build detail response: changes whenever the build row does."""
+    updated = (
+        build.build_finished_time or build.build_start_time or build.build_submitted_time
+    )
+    return f"{build.id}-{updated.timestamp() if updated else 0}"
+
+
+def get_project_info_from_build(build: AnyBuild) -> Dict[str, Any]:
     project = build.get_project()
     if not project:
         return {}
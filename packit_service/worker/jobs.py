@@ -24,12 +24,18 @@
 We love you, Steve Jobs.
 """
 import logging
+import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
-from typing import List, Set, Type, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union
+
+from time import monotonic
 
 from celery import group
 
-from packit.config import JobConfig, PackageConfig
+from ogr.abstract import GitProject
+from packit.config import JobConfig, JobType, PackageConfig
 from packit_service.config import ServiceConfig
 from packit_service.log_versions import log_job_versions
 from packit_service.service.events import (
@@ -62,9 +68,85 @@ from packit_service.worker.allowlist import Allowlist
 
 REQUESTED_PULL_REQUEST_COMMENT = "/packit"
 
+# project.is_private() costs a forge API round-trip and runs for every
+# incoming event, while repo visibility changes very rarely: remember the
+# answer per project for a while
+PRIVATE_REPO_CHECK_TTL = 300  # seconds
+PRIVATE_REPO_CACHE_MAXSIZE = 10_000
+_private_repo_cache: Dict[str, Tuple[float, bool]] = {}
+
+# first command word, optional second one and the rest of the comment,
+# mirroring what `comment.split(maxsplit=3)` used to produce
+PACKIT_COMMAND_RE = re.compile(
+    rf"{REQUESTED_PULL_REQUEST_COMMENT}\s+(\S+)(?:\s+(\S+))?(?:\s+(\S[\s\S]*))?"
+)
+
+# hoisted so that the per-event isinstance() checks don't rebuild the tuple
+COMMENT_EVENT_TYPES = (
+    PullRequestCommentGithubEvent,
+    PullRequestCommentPagureEvent,
+    IssueCommentEvent,
+    MergeRequestCommentGitlabEvent,
+    IssueCommentGitlabEvent,
+)
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_handlers_for_job_type(job_type: JobType) -> FrozenSet[Type[JobHandler]]:
+    """
+    Union of the configured and required handlers for the given job type.
+
+    The handler registrations are fixed once the handler modules are imported,
+    so the set union is computed only once per job type instead of on every
+    processed event.
+    """
+    return frozenset(
+        MAP_JOB_TYPE_TO_HANDLER[job_type] | MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job_type]
+    )
+
+
+@lru_cache(maxsize=None)
+def get_supported_events_for_handler(
+    handler: Type[JobHandler],
+) -> Tuple[Type[Event], ...]:
+    """
+    Supported event classes of the given handler as a tuple usable
+    with isinstance(), memoized to avoid rebuilding it per event.
+    """
+    return tuple(SUPPORTED_EVENTS_FOR_HANDLER[handler])
+
+
+def is_project_private(project: GitProject) -> bool:
+    """ TTL-cached project.is_private() keyed by service/namespace/repo """
+    key = f"{project.service.hostname}/{project.namespace}/{project.repo}"
+    now = monotonic()
+    cached = _private_repo_cache.get(key)
+    if cached and now - cached[0] < PRIVATE_REPO_CHECK_TTL:
+        return cached[1]
+
+    if len(_private_repo_cache) >= PRIVATE_REPO_CACHE_MAXSIZE:
+        _private_repo_cache.clear()
+    is_private = project.is_private()
+    _private_repo_cache[key] = (now, is_private)
+    return is_private
+
+
+@lru_cache(maxsize=1)
+def get_handler_topics() -> FrozenSet[str]:
+    """
+    Topics of all job handlers.
+
+    The subclass graph is fixed once the handler modules are imported, so walk
+    it only once instead of on every processed message. If handlers were ever
+    registered at runtime, get_handler_topics.cache_clear() invalidates this.
+    """
+    return frozenset(
+        getattr(handler, "topic", None) for handler in JobHandler.get_all_subclasses()
+    )
+
+
 def get_handlers_for_event(
     event: Event, package_config: PackageConfig
 ) -> Set[Type[JobHandler]]:
@@ -83,35 +165,21 @@ def get_handlers_for_event(
     :return: set of handler instances that we need to run for given event and user configuration
     """
 
+    trigger_type = event.db_trigger.job_config_trigger_type
     jobs_matching_trigger = []
     for job in package_config.jobs:
-        if (
-            job.trigger == event.db_trigger.job_config_trigger_type
-            and job not in jobs_matching_trigger
-        ):
+        if job.trigger == trigger_type and job not in jobs_matching_trigger:
             jobs_matching_trigger.append(job)
 
-    if isinstance(
-        event,
-        (
-            PullRequestCommentGithubEvent,
-            PullRequestCommentPagureEvent,
-            IssueCommentEvent,
-            MergeRequestCommentGitlabEvent,
-            IssueCommentGitlabEvent,
-        ),
-    ):
+    if isinstance(event, COMMENT_EVENT_TYPES):
         handlers_triggered_by_comment = get_handlers_for_comment(event.comment)
     else:
         handlers_triggered_by_comment = None
 
     matching_handlers: Set[Type["JobHandler"]] = set()
     for job in jobs_matching_trigger:
-        for handler in (
-            MAP_JOB_TYPE_TO_HANDLER[job.type]
-            | MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]
-        ):
-            if isinstance(event, tuple(SUPPORTED_EVENTS_FOR_HANDLER[handler])) and (
+        for handler in get_handlers_for_job_type(job.type):
+            if isinstance(event, get_supported_events_for_handler(handler)) and (
                 handlers_triggered_by_comment is None
                 or handler in handlers_triggered_by_comment
             ):
@@ -119,37 +187,84 @@ def get_handlers_for_event(
 
     if not matching_handlers:
         logger.debug(
-            f"We did not find any handler for a following event:\n{event.__class__}"
+            "We did not find any handler for a following event:\n%s", event.__class__
         )
 
     return matching_handlers
 
 
-def get_packit_commands_from_comment(comment: str) -> List[str]:
-    comment_parts = comment.strip()
+def get_config_map_for_event(
+    event: Event, package_config: PackageConfig
+) -> Dict[Type[JobHandler], List[JobConfig]]:
+    """
+    Map every handler matching the given event to the JobConfigs it should
+    run with, in a single pass over the configured jobs.
 
-    if not comment_parts:
-        logger.debug("Empty comment, nothing to do.")
-        return []
+    The matching semantics are the same as calling get_config_for_handler_kls
+    for each handler returned by get_handlers_for_event, but without
+    rescanning package_config.jobs once per handler.
 
-    cmd_start_index = comment.find(REQUESTED_PULL_REQUEST_COMMENT)
+    :param event: event which we are reacting to
+    :param package_config: we pick the JobConfig(s) from this package_config instance
+    :return: mapping of handler class to the JobConfigs relevant to it,
+             preserving the order of the configs in the package_config
+    """
+    trigger_type = event.db_trigger.job_config_trigger_type
+    jobs_matching_trigger = [
+        job for job in package_config.jobs if job.trigger == trigger_type
+    ]
 
-    if cmd_start_index == -1:
-        logger.debug(f"comment '{comment}' is not handled by packit-service.")
-        return []
+    if isinstance(event, COMMENT_EVENT_TYPES):
+        handlers_triggered_by_comment = get_handlers_for_comment(event.comment)
+    else:
+        handlers_triggered_by_comment = None
 
-    (packit_mark, *packit_command) = comment[cmd_start_index:].split(maxsplit=3)
-    # packit_command[0] has the first cmd and [1] has the second, if needed.
+    configured_jobs: Dict[Type[JobHandler], List[JobConfig]] = defaultdict(list)
+    required_jobs: Dict[Type[JobHandler], List[JobConfig]] = defaultdict(list)
+    for job in jobs_matching_trigger:
+        for handler in MAP_JOB_TYPE_TO_HANDLER[job.type]:
+            configured_jobs[handler].append(job)
+        for handler in MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]:
+            required_jobs[handler].append(job)
+
+    job_configs_by_handler: Dict[Type[JobHandler], List[JobConfig]] = {}
+    # dict merge instead of two set allocations; also keeps the handler
+    # order deterministic (order of the jobs in the config)
+    for handler in {**configured_jobs, **required_jobs}:
+        if not isinstance(event, get_supported_events_for_handler(handler)):
+            continue
+        if (
+            handlers_triggered_by_comment is not None
+            and handler not in handlers_triggered_by_comment
+        ):
+            continue
+        # if the handler is not configured directly,
+        # pick the job-configs which require it (e.g. tests require build)
+        job_configs_by_handler[handler] = configured_jobs.get(
+            handler
+        ) or required_jobs.get(handler, [])
+
+    if not job_configs_by_handler:
+        logger.debug(
+            "We did not find any handler for a following event:\n%s", event.__class__
+        )
+
+    return job_configs_by_handler
 
-    if packit_mark != REQUESTED_PULL_REQUEST_COMMENT:
-        logger.debug(f"comment '{comment}' is not handled by packit-service.")
+
+def get_packit_commands_from_comment(comment: str) -> List[str]:
+    if not comment.strip():
+        logger.debug("Empty comment, nothing to do.")
         return []
 
-    if not packit_command:
-        logger.debug(f"comment '{comment}' does not contain a packit-service command.")
+    match = PACKIT_COMMAND_RE.search(comment)
+    # single compiled-regex scan instead of find + split + slicing
+    # [0] has the first cmd and [1] has the second, if needed.
+    if not match:
+        logger.debug("comment %r does not contain a packit-service command.", comment)
         return []
 
-    return packit_command
+    return [group for group in match.groups() if group]
 
 
 def get_handlers_for_comment(comment: str) -> Set[Type[JobHandler]]:
@@ -159,7 +274,7 @@ def get_handlers_for_comment(comment: str) -> Set[Type[JobHandler]]:
 
     handlers = MAP_COMMENT_TO_HANDLER[commands[0]]
     if not handlers:
-        logger.debug(f"Command {commands[0]} not supported by packit.")
+        logger.debug("Command %s not supported by packit.", commands[0])
     return handlers
 
 
@@ -185,9 +300,10 @@ def get_config_for_handler_kls(
     :return: list of JobConfigs relevant to the given handler and event
              preserving the order in the config
     """
+    trigger_type = event.db_trigger.job_config_trigger_type
     jobs_matching_trigger: List[JobConfig] = []
     for job in package_config.jobs:
-        if job.trigger == event.db_trigger.job_config_trigger_type:
+        if job.trigger == trigger_type:
             jobs_matching_trigger.append(job)
 
     matching_jobs: List[JobConfig] = []
@@ -215,6 +331,10 @@ class SteveJobs:
     Steve makes sure all the jobs are done with precision.
     """
 
+    # shared across instances: a SteveJobs is created per message and the
+    # allowlist client (FAS account system) is costly to construct
+    _allowlist: Optional[Allowlist] = None
+
     def __init__(self):
         self._service_config = None
         log_job_versions()
@@ -225,6 +345,12 @@ class SteveJobs:
             self._service_config = ServiceConfig.get_service_config()
         return self._service_config
 
+    @property
+    def allowlist(self) -> Allowlist:
+        if SteveJobs._allowlist is None:
+            SteveJobs._allowlist = Allowlist()
+        return SteveJobs._allowlist
+
     def process_jobs(self, event: Event) -> List[TaskResults]:
         """
         Create a Celery task for a job handler (if trigger matches) for every job defined in config.
@@ -242,26 +368,18 @@ class SteveJobs:
                 )
             ]
 
-        handler_classes = get_handlers_for_event(event, event.package_config)
+        job_configs_by_handler = get_config_map_for_event(event, event.package_config)
 
-        if not handler_classes:
+        if not job_configs_by_handler:
             logger.debug(
-                f"There is no handler for {event} event suitable for the configuration."
+                "There is no handler for %s event suitable for the configuration.",
+                event,
             )
             return []
 
-        allowlist = Allowlist()
-        job_configs = []
-
-        for handler_kls in handler_classes:
-            # TODO: merge to to get_handlers_for_event so
-            # so we don't need to go through the similar process twice.
-            job_configs = get_config_for_handler_kls(
-                handler_kls=handler_kls,
-                event=event,
-                package_config=event.package_config,
-            )
+        allowlist = self.allowlist
 
+        for handler_kls, job_configs in job_configs_by_handler.items():
             # check allowlist approval for every job to be able to track down which jobs
             # failed because of missing allowlist approval
             if not allowlist.check_and_report(
@@ -316,13 +434,10 @@ class SteveJobs:
         if topic:
             # let's pre-filter messages: we don't need to get debug logs from processing
             # messages when we know beforehand that we are not interested in messages for such topic
-            topics = [
-                getattr(handler, "topic", None)
-                for handler in JobHandler.get_all_subclasses()
-            ]
+            topics = get_handler_topics()
 
             if topic not in topics:
-                logger.debug(f"{topic} not in {topics}")
+                logger.debug("%s not in %s", topic, topics)
                 return []
 
         event_object: Any
@@ -340,7 +455,7 @@ class SteveJobs:
                 "Cannot obtain project from this event! "
                 "Skipping private repository check!"
             )
-        elif event_object.project.is_private():
+        elif is_project_private(event_object.project):
             service_with_namespace = (
                 f"{event_object.project.service.hostname}/"
                 f"{event_object.project.namespace}"
@@ -356,8 +471,9 @@ class SteveJobs:
                 )
                 return []
             logger.debug(
-                f"Working in `{service_with_namespace}` namespace "
-                f"which is private but enabled via configuration."
+                "Working in `%s` namespace which is private but enabled "
+                "via configuration.",
+                service_with_namespace,
             )
 
         handler: Union[
@@ -22,17 +22,123 @@
 
 import hashlib
 import logging
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple, Union
 
+import backoff
+import base64
 import github
 import gitlab
+from requests.adapters import HTTPAdapter
 
-from ogr.abstract import CommitStatus, GitProject
+from ogr.abstract import CommitStatus, GitProject, PullRequest
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
 
 logger = logging.getLogger(__name__)
 
+# how many commit statuses we set at the same time
+MAX_STATUS_WORKERS = 8
+
+# Required because Pagure API doesn't accept empty url.
+PAGURE_FALLBACK_URL = "https://wiki.centos.org/Manuals/ReleaseNotes/CentOSStream"
+
+# connection-pool size for the forge session: statuses are now set in
+# parallel and the default pool of 10 makes urllib3 open (and tear down)
+# extra connections instead of keeping them alive
+SESSION_POOL_CONNECTIONS = 16
+SESSION_POOL_MAXSIZE = 32
+
+
+def _ensure_pooled_session(service) -> None:
+    """
+    Widen the connection pool of the forge service's requests session (once
+    per session) so concurrent status POSTs reuse kept-alive connections
+    instead of paying a TCP+TLS handshake each.
+    """
+    session = getattr(service, "session", None)
+    if session is None or getattr(session, "_packit_pooled", False):
+        return
+    for prefix in ("https://", "http://"):
+        # keep whatever retry policy the service mounted
+        retries = session.get_adapter(prefix).max_retries
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                pool_connections=SESSION_POOL_CONNECTIONS,
+                pool_maxsize=SESSION_POOL_MAXSIZE,
+                max_retries=retries,
+            ),
+        )
+    session._packit_pooled = True
+
+
+def _not_transient(exc: Exception) -> bool:
+    """
+    Permanent failures (bad request, missing permissions, missing commit)
+    should go straight to the commit-comment fallback; only rate limiting
+    and upstream 5xx are worth retrying.
+    """
+    status = getattr(exc, "response_code", None) or getattr(exc, "status", None)
+    return status != 429 and not (status is not None and status >= 500)
+
+
+# a commit sha is immutable and its statuses change only when we (or another
+# reporter) set them, so repeated fetches within a short window can share one
+# upstream call - e.g. on bursty webhook retries for the same commit
+COMMIT_STATUSES_TTL = 30  # seconds
+COMMIT_STATUSES_CACHE_MAXSIZE = 1_000
+_commit_statuses_cache: Dict[
+    Tuple[Optional[str], Optional[str], str], Tuple[float, Any]
+] = {}
+
+
+def _statuses_cache_key(
+    project: GitProject, commit_sha: str
+) -> Tuple[Optional[str], Optional[str], str]:
+    # the same sha can carry different statuses on different projects
+    # (e.g. GitLab source vs target project), so the sha alone is not
+    # a safe key; namespace/repo are plain attributes, unlike the
+    # full_repo_name property which forge-less projects don't implement
+    return (
+        getattr(project, "namespace", None),
+        getattr(project, "repo", None),
+        commit_sha,
+    )
+
+
+def _get_commit_statuses_cached(project: GitProject, commit_sha: str) -> Any:
+    """ TTL-cached project.get_commit_statuses() keyed by (project, sha) """
+    now = monotonic()
+    key = _statuses_cache_key(project, commit_sha)
+    cached = _commit_statuses_cache.get(key)
+    if cached and now - cached[0] < COMMIT_STATUSES_TTL:
+        return cached[1]
+
+    if len(_commit_statuses_cache) >= COMMIT_STATUSES_CACHE_MAXSIZE:
+        _commit_statuses_cache.clear()
+    statuses = project.get_commit_statuses(commit=commit_sha)
+    _commit_statuses_cache[key] = (now, statuses)
+    return statuses
+
+
+@lru_cache(maxsize=1024)
+def _check_name_uid(check_name: str) -> str:
+    """
+    Deterministic uid of a check name, used to update Pagure flags we set
+    previously instead of creating new ones. The same check is flagged
+    repeatedly over a build's lifecycle, hence the memoization.
+
+    Pagure only needs the uid to be stable per check; blake2b is the
+    fastest stable digest in the stdlib (no cryptographic property is
+    required here) and base64 halves the uid size compared to hexdigest
+    while keeping 96 bits of it.
+    """
+    digest = hashlib.blake2b(check_name.encode(), digest_size=12).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
 
 class StatusReporter:
     def __init__(
@@ -42,26 +148,43 @@ class StatusReporter:
         pr_id: Optional[int] = None,
     ):
         logger.debug(
-            f"Status reporter will report for {project}, commit={commit_sha}, pr={pr_id}"
+            "Status reporter will report for %s, commit=%s, pr=%s",
+            project,
+            commit_sha,
+            pr_id,
         )
         self.project = project
-        self._project_with_commit = None
+        _ensure_pooled_session(getattr(project, "service", None))
+        self._pr: Optional[PullRequest] = None
+        # last successfully submitted (state, description, url) per check,
+        # to skip re-posting statuses that have not changed
+        self._last_set: Dict[str, Tuple[CommitStatus, str, str]] = {}
+        # resolved once; the forge type never changes and set_status
+        # runs per check on every report
+        self._is_gitlab = isinstance(project, GitlabProject)
+        self._is_pagure = isinstance(project, PagureProject)
         self.commit_sha = commit_sha
         self.pr_id = pr_id
 
-    @property
+    def _get_pr(self) -> PullRequest:
+        """
+        PR we report on, fetched once: report() sets the status per check
+        and each of those used to be a separate get_pr round trip.
+        """
+        if self._pr is None:
+            self._pr = self.project.get_pr(self.pr_id)
+        return self._pr
+
+    @cached_property
     def project_with_commit(self) -> GitProject:
         """
         Returns GitProject from which we can set commit status.
         """
-        if self._project_with_commit is None:
-            self._project_with_commit = (
-                self.project.get_pr(self.pr_id).source_project
-                if isinstance(self.project, GitlabProject) and self.pr_id is not None
-                else self.project
-            )
-
-        return self._project_with_commit
+        return (
+            self._get_pr().source_project
+            if self._is_gitlab and self.pr_id is not None
+            else self.project
+        )
 
     def report(
         self,
@@ -85,6 +208,34 @@ class StatusReporter:
 
         elif isinstance(check_names, str):
             check_names = [check_names]
+        else:
+            # merged check lists can contain duplicates; each one would be
+            # an identical (wasted) status POST
+            check_names = list(dict.fromkeys(check_names))
+
+        if len(check_names) > 1:
+            # the POSTs are independent and network-bound: send them in
+            # parallel so N checks take ~1 round trip instead of N;
+            # prime the cached PR/project first so the workers don't race
+            # on initializing them
+            self.project_with_commit
+            if self.pr_id is not None:
+                self._get_pr()
+            with ThreadPoolExecutor(
+                max_workers=min(len(check_names), MAX_STATUS_WORKERS)
+            ) as executor:
+                list(
+                    executor.map(
+                        lambda check: self.set_status(
+                            state=state,
+                            description=description,
+                            check_name=check,
+                            url=url,
+                        ),
+                        check_names,
+                    )
+                )
+            return
 
         for check in check_names:
             self.set_status(
@@ -96,7 +247,7 @@ class StatusReporter:
     ):
         if self.pr_id is None:
             return
-        pr = self.project.get_pr(self.pr_id)
+        pr = self._get_pr()
         if hasattr(pr, "set_flag") and pr.head_commit == self.commit_sha:
             logger.debug("Setting the PR status (pagure only).")
             pr.set_flag(
@@ -107,7 +258,7 @@ class StatusReporter:
                 # For Pagure: generate a custom uid from the check_name,
                 # so that we can update flags we set previously,
                 # instead of creating new ones.
-                uid=hashlib.md5(check_name.encode()).hexdigest(),
+                uid=_check_name_uid(check_name),
             )
 
     def report_status_by_comment(
@@ -123,33 +274,49 @@ class StatusReporter:
 
         if isinstance(check_names, str):
             check_names = [check_names]
+        else:
+            # don't list the same check twice in the table
+            check_names = list(dict.fromkeys(check_names))
 
-        comment_table_rows = [
-            "| Job | Result |",
-            "| ------------- | ------------ |",
-        ] + [f"| [{check}]({url}) | {state.name.upper()} |" for check in check_names]
-
-        table = "\n".join(comment_table_rows)
-        self.comment(table + f"\n### Description\n\n{description}")
+        # stream the rows straight into the join: no intermediate list,
+        # and the state name is formatted once, not per row
+        header = "| Job | Result |\n| ------------- | ------------ |\n"
+        state_name = state.name.upper()
+        rows = "\n".join(
+            f"| [{check}]({url}) | {state_name} |" for check in check_names
+        )
+        self.comment(f"{header}{rows}\n### Description\n\n{description}")
 
     def __add_commit_comment_with_status(
         self, state: CommitStatus, description: str, check_name: str, url: str = ""
     ):
+        state_name = state.name
         body = (
-            "\n".join(
-                [
-                    f"- name: {check_name}",
-                    f"- state: {state.name}",
-                    f"- url: {url if url else 'not provided'}",
-                ]
-            )
-            + f"\n\n{description}"
+            f"- name: {check_name}\n"
+            f"- state: {state_name}\n"
+            f"- url: {url if url else 'not provided'}\n\n"
+            f"{description}"
         )
         self.project.commit_comment(
             commit=self.commit_sha,
             body=body,
         )
 
+    @backoff.on_exception(
+        wait_gen=backoff.expo,
+        exception=(github.GithubException, gitlab.exceptions.GitlabCreateError),
+        max_tries=3,
+        giveup=_not_transient,
+    )
+    def _set_commit_status(
+        self, state: CommitStatus, description: str, check_name: str, url: str
+    ):
+        # rate limiting (429) and upstream 5xx are retried with backoff;
+        # the commit-comment fallback is noisy and costs API budget
+        self.project_with_commit.set_commit_status(
+            self.commit_sha, state, url, description, check_name, trim=True
+        )
+
     def set_status(
         self,
         state: CommitStatus,
@@ -157,17 +324,26 @@ class StatusReporter:
         check_name: str,
         url: str = "",
     ):
-        # Required because Pagure API doesn't accept empty url.
-        if not url and isinstance(self.project, PagureProject):
-            url = "https://wiki.centos.org/Manuals/ReleaseNotes/CentOSStream"
+        if not url and self._is_pagure:
+            url = PAGURE_FALLBACK_URL
+
+        # reconciliation loops re-report identical results; don't pay
+        # an API call for a status that has not changed
+        if self._last_set.get(check_name) == (state, description, url):
+            logger.debug("Status for check '%s' unchanged, skipping.", check_name)
+            return
 
         logger.debug(
-            f"Setting status '{state.name}' for check '{check_name}': {description}"
+            "Setting status '%s' for check '%s': %s", state.name, check_name, description
         )
 
         try:
-            self.project_with_commit.set_commit_status(
-                self.commit_sha, state, url, description, check_name, trim=True
+            self._set_commit_status(state, description, check_name, url)
+            self._last_set[check_name] = (state, description, url)
+            # we just changed the statuses; a cached fetch would serve
+            # the pre-POST snapshot for the rest of its TTL
+            _commit_statuses_cache.pop(
+                _statuses_cache_key(self.project_with_commit, self.commit_sha), None
             )
         except gitlab.exceptions.GitlabCreateError as e:
             # Ignoring Gitlab 'enqueue' error
@@ -176,8 +352,10 @@ class StatusReporter:
                 # 403: No permissions to set status, falling back to comment
                 # 404: Commit has not been found, e.g. used target project on GitLab
                 logger.debug(
-                    f"Failed to set status for {self.commit_sha}, commenting on"
-                    f" commit as a fallback: {str(e)}"
+                    "Failed to set status for %s, commenting on"
+                    " commit as a fallback: %s",
+                    self.commit_sha,
+                    e,
                 )
                 self.__add_commit_comment_with_status(
                     state, description, check_name, url
@@ -192,10 +370,10 @@ class StatusReporter:
         self.__set_pull_request_status(check_name, description, url, state)
 
     def get_statuses(self):
-        self.project_with_commit.get_commit_statuses(commit=self.commit_sha)
+        return _get_commit_statuses_cached(self.project_with_commit, self.commit_sha)
 
     def comment(self, body: str):
         if self.pr_id:
-            self.project.get_pr(pr_id=self.pr_id).comment(body=body)
+            self._get_pr().comment(body=body)
         else:
             self.project.commit_comment(commit=self.commit_sha, body=body)
@@ -1,7 +1,52 @@
 from packit_service.service.api.copr_builds import optional_time
 from datetime import datetime
+import json
 import pytest
 
+from flexmock import flexmock
+
+from packit_service.models import JobTriggerModel, KojiBuildModel
+from packit_service.service.app import packit_as_a_service as application
+
+
+@pytest.fixture
+def client():
+    application.config["TESTING"] = True
+    # this affects all tests actually, heads up!
+    application.config["SERVER_NAME"] = "localhost:5000"
+    application.config["PREFERRED_URL_SCHEME"] = "https"
+
+    with application.test_client() as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _setup_app_context_for_test():
+    """
+    Given app is session-wide, sets up a app context per test to ensure that
+    app and request stack is not shared between tests.
+    """
+    ctx = application.app_context()
+    ctx.push()
+    yield  # tests will run here
+    ctx.pop()
+
+
+def koji_build(id_: int) -> KojiBuildModel:
+    build = KojiBuildModel()
+    build.id = id_
+    build.build_id = str(1000 + id_)
+    build.status = "success"
+    build.target = "fedora-33-x86_64"
+    build.build_submitted_time = datetime(2020, 5, 1, 10, 0, 0)
+    build.build_start_time = datetime(2020, 5, 1, 10, 5, 0)
+    build.build_finished_time = datetime(2020, 5, 1, 10, 30, 0)
+    build.commit_sha = "687abc76d67d"
+    build.web_url = f"https://koji.fedoraproject.org/koji/buildinfo?buildID={id_}"
+    build.build_logs_url = f"https://kojipkgs.fedoraproject.org/{id_}/build.log"
+    build.srpm_build_id = 11
+    return build
+
 
 @pytest.mark.parametrize(
     "input_object,expected_type", [(datetime.utcnow(), str), (None, type(None))]
@@ -10,3 +55,75 @@ def test_optional_time(input_object, expected_type):
     # optional_time returns a string if its passed a datetime object
     # None if passed a NoneType object
     assert isinstance(optional_time(input_object), expected_type)
+
+
+def test_koji_build_etag_and_not_modified(client):
+    build = koji_build(1)
+    flexmock(KojiBuildModel).should_receive("get_by_id").with_args(1).and_return(build)
+    flexmock(KojiBuildModel).should_receive("get_project").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_pr_id").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_branch_name").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_release_tag").and_return(None)
+
+    response = client.get("/api/koji-builds/1")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    # a finished build never changes, tell the caches
+    assert "immutable" in response.headers["Cache-Control"]
+
+    # polling with the ETag skips the whole body
+    response = client.get("/api/koji-builds/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.data
+
+    # a different ETag still gets the full response
+    response = client.get("/api/koji-builds/1", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert json.loads(response.data)["build_id"] == build.build_id
+
+
+def test_koji_builds_list_streamed_body(client):
+    builds = [koji_build(2), koji_build(1)]
+    flexmock(KojiBuildModel).should_receive("get_range").with_args(
+        0, 10, after=None
+    ).and_return(builds).once()
+    flexmock(JobTriggerModel).should_receive("preload_trigger_objects").once()
+    flexmock(KojiBuildModel).should_receive("get_project").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_pr_id").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_branch_name").and_return("main")
+    flexmock(KojiBuildModel).should_receive("get_release_tag").and_return(None)
+
+    response = client.get("/api/koji-builds")
+    assert response.status_code == 206
+    assert response.headers["Content-Type"] == "application/json"
+
+    # the row-by-row chunks have to concatenate into one valid JSON array
+    body = json.loads(response.data)
+    assert [entry["packit_id"] for entry in body] == [2, 1]
+    assert body[0]["build_id"] == builds[0].build_id
+    assert body[0]["branch_name"] == "main"
+
+    # plain offset pagination keeps advertising the window
+    assert response.headers["Content-Range"] == "koji-builds 1-10/*"
+
+
+def test_koji_builds_list_keyset_pagination(client):
+    builds = [koji_build(30), koji_build(29)]
+    flexmock(KojiBuildModel).should_receive("get_range").with_args(
+        0, 10, after=31
+    ).and_return(builds).once()
+    flexmock(JobTriggerModel).should_receive("preload_trigger_objects").once()
+    flexmock(KojiBuildModel).should_receive("get_project").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_pr_id").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_branch_name").and_return(None)
+    flexmock(KojiBuildModel).should_receive("get_release_tag").and_return(None)
+
+    response = client.get("/api/koji-builds?after=31")
+    assert response.status_code == 206
+
+    # the next page continues after the last returned id
+    assert response.headers["Link"] == (
+        '<https://localhost:5000/api/koji-builds?after=29&per_page=10>; rel="next"'
+    )
+    # page/per_page offsets say nothing about a keyset window
+    assert "Content-Range" not in response.headers
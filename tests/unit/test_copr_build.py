@@ -945,8 +945,7 @@ def test_copr_build_fails_to_update_copr_project(github_pr_event):
     )
 
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
-    flexmock(GitProject).should_receive("get_pr").with_args(342).and_return(flexmock())
-    flexmock(GitProject).should_receive("get_pr").with_args(pr_id=342).and_return(
+    flexmock(GitProject).should_receive("get_pr").with_args(342).and_return(
         flexmock(source_project=flexmock())
         .should_receive("comment")
         .with_args(
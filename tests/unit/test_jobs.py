@@ -38,7 +38,9 @@ from packit_service.worker.handlers.github_handlers import (
 )
 from packit_service.worker.jobs import (
     get_config_for_handler_kls,
+    get_config_map_for_event,
     get_handlers_for_event,
+    get_packit_commands_from_comment,
 )
 
 
@@ -1697,3 +1699,190 @@ def test_get_config_for_handler_kls(
         package_config=flexmock(jobs=jobs),
     )
     assert job_config == result_job_config
+
+
+@pytest.mark.parametrize(
+    "comment,expected_commands",
+    [
+        pytest.param("", [], id="empty_comment"),
+        pytest.param("I totally approve this", [], id="no_command"),
+        pytest.param("/packit", [], id="no_arguments"),
+        pytest.param("/packit build", ["build"], id="single_command"),
+        pytest.param(
+            "/packit propose-downstream f33",
+            ["propose-downstream", "f33"],
+            id="command_with_argument",
+        ),
+        pytest.param(
+            "LGTM, let's check it once more:\n/packit build",
+            ["build"],
+            id="command_inside_comment",
+        ),
+        pytest.param(
+            "/packit test arg and the rest\nof the comment",
+            ["test", "arg", "and the rest\nof the comment"],
+            id="command_with_trailing_text",
+        ),
+    ],
+)
+def test_get_packit_commands_from_comment(comment, expected_commands):
+    assert get_packit_commands_from_comment(comment) == expected_commands
+
+
+@pytest.mark.parametrize(
+    "event_cls,comment,db_trigger,jobs,result",
+    [
+        pytest.param(
+            PullRequestGithubEvent,
+            None,
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.build,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+            ],
+            {
+                CoprBuildHandler: [
+                    JobConfig(
+                        type=JobType.build,
+                        trigger=JobConfigTriggerType.pull_request,
+                    )
+                ],
+            },
+            id="config=build_for_pr&pull_request&PullRequestGithubEvent",
+        ),
+        # handler not configured directly, picked via the required jobs:
+        pytest.param(
+            PullRequestGithubEvent,
+            None,
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.tests,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+            ],
+            {
+                CoprBuildHandler: [
+                    JobConfig(
+                        type=JobType.tests,
+                        trigger=JobConfigTriggerType.pull_request,
+                    )
+                ],
+            },
+            id="config=test_for_pr&pull_request&PullRequestGithubEvent",
+        ),
+        pytest.param(
+            PullRequestGithubEvent,
+            None,
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.build,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+                JobConfig(
+                    type=JobType.production_build,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+            ],
+            {
+                CoprBuildHandler: [
+                    JobConfig(
+                        type=JobType.build,
+                        trigger=JobConfigTriggerType.pull_request,
+                    )
+                ],
+                KojiBuildHandler: [
+                    JobConfig(
+                        type=JobType.production_build,
+                        trigger=JobConfigTriggerType.pull_request,
+                    )
+                ],
+            },
+            id="config=build_for_pr+production_build_for_pr"
+            "&pull_request&PullRequestGithubEvent",
+        ),
+        # Not matching event:
+        pytest.param(
+            PullRequestGithubEvent,
+            None,
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.build,
+                    trigger=JobConfigTriggerType.commit,
+                ),
+            ],
+            {},
+            id="config=build_for_commit&pull_request&PullRequestGithubEvent",
+        ),
+        # comments:
+        pytest.param(
+            PullRequestCommentGithubEvent,
+            "/packit build",
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.build,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+            ],
+            {
+                CoprBuildHandler: [
+                    JobConfig(
+                        type=JobType.build,
+                        trigger=JobConfigTriggerType.pull_request,
+                    )
+                ],
+            },
+            id="config=build_for_pr&pull_request&PullRequestCommentGithubEvent"
+            "&packit_build",
+        ),
+        pytest.param(
+            PullRequestCommentGithubEvent,
+            "",
+            flexmock(job_config_trigger_type=JobConfigTriggerType.pull_request),
+            [
+                JobConfig(
+                    type=JobType.build,
+                    trigger=JobConfigTriggerType.pull_request,
+                ),
+            ],
+            {},
+            id="config=build_for_pr&pull_request&PullRequestCommentGithubEvent"
+            "&empty_comment",
+        ),
+    ],
+)
+def test_get_config_map_for_event(event_cls, comment, db_trigger, jobs, result):
+    # We are using isinstance for matching event to handlers
+    # and flexmock can't do this for us so we need a subclass to test it.
+    # (And real event classes have a lot of __init__ arguments.)
+    class Event(event_cls):  # type: ignore
+        def __init__(self):
+            if comment is not None:
+                self.comment = comment
+
+        @property
+        def db_trigger(self):
+            return db_trigger
+
+    event = Event()
+
+    config_map = get_config_map_for_event(
+        event=event,
+        package_config=flexmock(jobs=jobs),
+    )
+    assert config_map == result
+    # the single-pass map has to agree with the per-handler lookups
+    assert set(config_map) == set(
+        get_handlers_for_event(event=event, package_config=flexmock(jobs=jobs))
+    )
+    for handler_kls, job_configs in config_map.items():
+        assert job_configs == get_config_for_handler_kls(
+            handler_kls=handler_kls,
+            event=event,
+            package_config=flexmock(jobs=jobs),
+        )
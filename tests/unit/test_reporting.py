@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+
 import github
 import gitlab
 import pytest
@@ -87,7 +89,7 @@ from packit_service.worker.reporting import StatusReporter
             "packit/pagure-rpm-build",
             "https://api.packit.dev/build/114/logs",
             True,
-            "8d8d0d428ccee1112042f6d06f6b334a",
+            "5eM-DbTK_vX5_ig7",
             id="Pagure PR, head commit",
         ),
     ],
@@ -288,7 +290,7 @@ def test_report_status_by_comment(
     )
 
     if pr_id:
-        project.should_receive("get_pr").with_args(pr_id=pr_id).and_return(
+        project.should_receive("get_pr").with_args(pr_id).and_return(
             flexmock().should_receive("comment").with_args(body=comment_body).mock()
         ).once()
     else:
@@ -298,3 +300,44 @@ def test_report_status_by_comment(
         ).once()
 
     reporter.report_status_by_comment(state, url, check_names, "should include this")
+
+
+def test_set_status_skips_unchanged():
+    project = flexmock()
+    commit_sha = "7654321"
+    check_name = "packit/branch-rpm-build"
+    url = "https://api.packit.dev/build/111/logs"
+    reporter = StatusReporter(project, commit_sha)
+
+    project.should_receive("set_commit_status").with_args(
+        commit_sha, CommitStatus.pending, url, "In progress", check_name, trim=True
+    ).once()
+    reporter.set_status(CommitStatus.pending, "In progress", check_name, url)
+    # re-reporting the very same result must not cost another API call
+    reporter.set_status(CommitStatus.pending, "In progress", check_name, url)
+
+    # but a changed state has to go out
+    project.should_receive("set_commit_status").with_args(
+        commit_sha, CommitStatus.success, url, "We made it!", check_name, trim=True
+    ).once()
+    reporter.set_status(CommitStatus.success, "We made it!", check_name, url)
+
+
+def test_set_status_retries_on_transient_error():
+    project = flexmock()
+    commit_sha = "7654321"
+    check_name = "packit/branch-rpm-build"
+    url = "https://api.packit.dev/build/111/logs"
+    reporter = StatusReporter(project, commit_sha)
+
+    # don't wait out the backoff delays
+    flexmock(time).should_receive("sleep")
+
+    # upstream hiccup (502) on the first attempt, success on the retry;
+    # no commit-comment fallback should be needed
+    project.should_receive("set_commit_status").with_args(
+        commit_sha, CommitStatus.success, url, "We made it!", check_name, trim=True
+    ).and_raise(github.GithubException, 502, "Bad gateway").and_return(None).times(2)
+    project.should_receive("commit_comment").never()
+
+    reporter.set_status(CommitStatus.success, "We made it!", check_name, url)